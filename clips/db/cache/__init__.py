@@ -0,0 +1,18 @@
+"""Caches in front of the database."""
+
+from clips.db.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from clips.db.cache.clip_cache import ClipCache, clip_cache
+from clips.db.cache.lru import LRUCache
+
+__all__ = [
+    "CacheBackend",
+    "ClipCache",
+    "LRUCache",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "clip_cache",
+]
@@ -0,0 +1,257 @@
+import abc
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from typing import DefaultDict, Optional
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from clips.db.cache.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(abc.ABC):
+    """Storage used by caches, values are stored as bytes."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get value by key.
+
+        :param key: cache key.
+        :return: stored value or None if it's missing or expired.
+        """
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store value by key.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: seconds the value stays valid.
+        """
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove value by key.
+
+        :param key: cache key.
+        """
+
+    @abc.abstractmethod
+    async def incr(self, key: str) -> int:
+        """
+        Increment a counter which never expires.
+
+        Counters are used to version groups of keys,
+        so whole groups can be invalidated at once.
+
+        :param key: counter key.
+        :return: new value of the counter.
+        """
+
+    async def get_counter(self, key: str) -> int:
+        """
+        Get current value of a counter.
+
+        :param key: counter key.
+        :return: value of the counter, 0 if it was never incremented.
+        """
+        value = await self.get(key)
+        return int(value) if value is not None else 0
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        """Remove all values."""
+
+    async def start(self) -> None:  # noqa: B027
+        """Start background work of the backend."""
+
+    async def stop(self) -> None:  # noqa: B027
+        """Stop background work of the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache backend storing values in memory of the current process.
+
+    Every uvicorn worker gets its own copy of the cache,
+    so writes are only visible to the worker that made them.
+    """
+
+    def __init__(self, entries: LRUCache[str, bytes]) -> None:
+        self.entries = entries
+        self.counters: DefaultDict[str, int] = defaultdict(int)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get value by key.
+
+        :param key: cache key.
+        :return: stored value or None if it's missing or expired.
+        """
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store value by key.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: seconds the value stays valid.
+        """
+        self.entries.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove value by key.
+
+        :param key: cache key.
+        """
+        self.entries.invalidate(key)
+
+    async def incr(self, key: str) -> int:
+        """
+        Increment a counter which never expires.
+
+        :param key: counter key.
+        :return: new value of the counter.
+        """
+        self.counters[key] += 1
+        return self.counters[key]
+
+    async def get_counter(self, key: str) -> int:
+        """
+        Get current value of a counter.
+
+        :param key: counter key.
+        :return: value of the counter, 0 if it was never incremented.
+        """
+        return self.counters.get(key, 0)
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        self.entries.clear()
+        self.counters.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend shared by all workers through redis.
+
+    Each worker also keeps recently used values in a small local cache,
+    so hot keys don't need a round-trip to redis. Whenever a key changes,
+    its name is published to ``channel`` and every worker
+    drops the key from its local cache.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        local: LRUCache[str, bytes],
+        prefix: str = "clips:cache:",
+        channel: str = "clips:cache:invalidate",
+    ) -> None:
+        self.redis = redis
+        self.local = local
+        self.prefix = prefix
+        self.channel = channel
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get value by key.
+
+        :param key: cache key.
+        :return: stored value or None if it's missing or expired.
+        """
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        value = await self.redis.get(self.prefix + key)
+        if value is not None:
+            self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store value by key.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: seconds the value stays valid.
+        """
+        await self.redis.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+        self.local.set(key, value, ttl=min(ttl, self.local.ttl))
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove value by key and notify other workers.
+
+        :param key: cache key.
+        """
+        await self.redis.delete(self.prefix + key)
+        await self._invalidate(key)
+
+    async def incr(self, key: str) -> int:
+        """
+        Increment a counter and notify other workers.
+
+        :param key: counter key.
+        :return: new value of the counter.
+        """
+        value = await self.redis.incr(self.prefix + key)
+        await self._invalidate(key)
+        return int(value)
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.prefix}*")]
+        if keys:
+            await self.redis.delete(*keys)
+        self.local.clear()
+
+    async def start(self) -> None:
+        """Subscribe to invalidations from other workers."""
+        if self._listener is not None:
+            return
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(self._pubsub))
+
+    async def stop(self) -> None:
+        """Unsubscribe from invalidations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def _invalidate(self, key: str) -> None:
+        self.local.invalidate(key)
+        await self.redis.publish(self.channel, key)
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        while True:
+            try:
+                message = await pubsub.get_message(timeout=1.0)
+            except Exception as exc:
+                logger.error(f"Cannot receive cache invalidations: {exc!s}")
+                await asyncio.sleep(1)
+                continue
+            if message is None:
+                continue
+            key = message["data"]
+            if isinstance(key, bytes):
+                key = key.decode()
+            self.local.invalidate(key)
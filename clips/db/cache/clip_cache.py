@@ -0,0 +1,142 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+from piccolo.columns import Timestamp, Timestamptz
+
+from clips.db.cache.backends import CacheBackend, MemoryCacheBackend
+from clips.db.cache.lru import LRUCache
+from clips.db.models.clip_model import ClipModel
+from clips.metrics import CACHE_HITS, CACHE_MISSES
+from clips.settings import settings
+
+TIMESTAMP_COLUMNS = [
+    column._meta.name
+    for column in ClipModel._meta.columns
+    if isinstance(column, (Timestamp, Timestamptz))
+]
+LISTS_VERSION_KEY = "clip-lists:version"
+
+
+def dump_clip(clip: ClipModel) -> Dict[str, Any]:
+    """
+    Convert clip to a JSON compatible dict.
+
+    :param clip: clip to convert.
+    :return: column values of the clip.
+    """
+    row = clip.to_dict()
+    for name in TIMESTAMP_COLUMNS:
+        if row[name] is not None:
+            row[name] = row[name].isoformat()
+    return row
+
+
+def load_clip(row: Dict[str, Any]) -> ClipModel:
+    """
+    Build clip from a dict created by :func:`dump_clip`.
+
+    :param row: column values of the clip.
+    :return: clip instance.
+    """
+    for name in TIMESTAMP_COLUMNS:
+        if row.get(name) is not None:
+            row[name] = datetime.fromisoformat(row[name])
+    return ClipModel(**row, _exists_in_db=True)
+
+
+class ClipCache:
+    """
+    Cache of single clips and pages of clip lists.
+
+    Single clips are invalidated by ID. List pages are stored under
+    a version number, so any change of the catalogue invalidates
+    all of them at once by bumping the version.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, list_ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.list_ttl = list_ttl
+
+    async def get_clip(self, clip_id: int) -> Optional[ClipModel]:
+        """
+        Get cached clip.
+
+        :param clip_id: ID of the clip.
+        :return: cached clip or None.
+        """
+        value = await self.backend.get(f"clip:{clip_id}")
+        if value is None:
+            CACHE_MISSES.labels("clip").inc()
+            return None
+        CACHE_HITS.labels("clip").inc()
+        return load_clip(json.loads(value))
+
+    async def set_clip(self, clip: ClipModel) -> None:
+        """
+        Store clip in cache.
+
+        :param clip: clip to store.
+        """
+        value = json.dumps(dump_clip(clip)).encode()
+        await self.backend.set(f"clip:{clip.id}", value, ttl=self.ttl)
+
+    async def invalidate_clip(self, clip_id: int) -> None:
+        """
+        Remove clip from cache.
+
+        :param clip_id: ID of the clip.
+        """
+        await self.backend.delete(f"clip:{clip_id}")
+
+    async def get_list(self, params: Sequence[Hashable]) -> Optional[List[ClipModel]]:
+        """
+        Get cached page of clips.
+
+        :param params: parameters of the query that produced the page.
+        :return: cached clips or None.
+        """
+        value = await self.backend.get(await self._list_key(params))
+        if value is None:
+            CACHE_MISSES.labels("clip_list").inc()
+            return None
+        CACHE_HITS.labels("clip_list").inc()
+        return [load_clip(row) for row in json.loads(value)]
+
+    async def set_list(
+        self,
+        params: Sequence[Hashable],
+        clips: List[ClipModel],
+    ) -> None:
+        """
+        Store page of clips in cache.
+
+        :param params: parameters of the query that produced the page.
+        :param clips: clips of the page.
+        """
+        value = json.dumps([dump_clip(clip) for clip in clips]).encode()
+        await self.backend.set(await self._list_key(params), value, ttl=self.list_ttl)
+
+    async def invalidate_lists(self) -> None:
+        """Remove all cached pages of clips."""
+        await self.backend.incr(LISTS_VERSION_KEY)
+
+    async def clear(self) -> None:
+        """Remove everything from cache."""
+        await self.backend.clear()
+
+    async def _list_key(self, params: Sequence[Hashable]) -> str:
+        version = await self.backend.get_counter(LISTS_VERSION_KEY)
+        return f"clip-list:{version}:{json.dumps(params, default=str)}"
+
+
+clip_cache = ClipCache(
+    MemoryCacheBackend(
+        LRUCache(
+            "clip", max_size=settings.clip_cache_size, ttl=settings.clip_cache_ttl
+        ),
+    ),
+    ttl=settings.clip_cache_ttl,
+    list_ttl=settings.clip_list_cache_ttl,
+)
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from clips.metrics import CACHE_EVICTIONS
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class LRUCache(Generic[KeyT, ValueT]):
+    """
+    Bounded in-process cache with time-based expiry.
+
+    When the cache is full, the least recently used entry is evicted.
+    Entries older than their ttl are treated as missing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[KeyT, Tuple[float, ValueT]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """
+        Get value from cache.
+
+        :param key: cache key.
+        :return: cached value or None if it's missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: KeyT, value: ValueT, ttl: Optional[float] = None) -> None:
+        """
+        Put value in cache.
+
+        :param key: cache key.
+        :param value: value to store.
+        :param ttl: seconds the value stays valid, defaults to ttl of the cache.
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.labels(self.name).inc()
+
+    def invalidate(self, key: KeyT) -> None:
+        """
+        Remove value from cache.
+
+        :param key: cache key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from cache."""
+        self._entries.clear()
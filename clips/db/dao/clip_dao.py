@@ -1,7 +1,29 @@
-from typing import Any, List, Optional
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+from piccolo.columns.combination import WhereRaw
+from piccolo.querystring import QueryString
+
+from clips.db.cache import clip_cache
 from clips.db.models.clip_model import ClipModel
 
+SEARCH_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def build_prefix_tsquery(query: str) -> str:
+    """
+    Convert free text into a tsquery matching word prefixes.
+
+    Every word must match, and the words may be incomplete,
+    so "imag drag" finds "Imagine Dragons".
+
+    :param query: Search query string
+    :return: tsquery text, empty when the query has no words
+    """
+    words = SEARCH_WORD_RE.findall(query.lower())
+    return " & ".join(f"{word}:*" for word in words)
+
 
 class ClipDAO:
     """Class for accessing clip table."""
@@ -44,39 +66,72 @@ class ClipDAO:
             .limit(1)
         )
 
-        return created_clips[0] if created_clips else None
+        if not created_clips:
+            return None
+        await clip_cache.invalidate_clip(created_clips[0].id)
+        await clip_cache.invalidate_lists()
+        return created_clips[0]
 
     async def get_all_clips(
         self,
         limit: int = 20,
         offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
     ) -> List[ClipModel]:
         """
         Get all clips with pagination.
 
+        Clips are ordered from newest to oldest. When ``after`` is given,
+        keyset pagination is used instead of ``offset``, so the query
+        starts right after the given clip using the index on
+        ``(created_at, id)`` no matter how deep the page is.
+        Pages are cached for a short time, play counts
+        don't invalidate them.
+
         :param limit: Maximum number of clips to return
         :param offset: Number of clips to skip
+        :param after: ``(created_at, id)`` of the last clip of previous page
         :return: List of clip models
         """
-        return (
-            await ClipModel.objects()
-            .order_by(
-                ClipModel.created_at,
-                ascending=False,
-            )
-            .limit(limit)
-            .offset(offset)
+        cache_params = ("all", limit, offset, after)
+        cached = await clip_cache.get_list(cache_params)
+        if cached is not None:
+            return cached
+
+        query = ClipModel.objects().order_by(
+            ClipModel.created_at,
+            ClipModel.id,
+            ascending=False,
         )
+        if after is not None:
+            created_at, clip_id = after
+            query = query.where(
+                WhereRaw("(created_at, id) < ({}, {})", created_at, clip_id),
+            )
+        else:
+            query = query.offset(offset)
+        clips = await query.limit(limit)
+        await clip_cache.set_list(cache_params, clips)
+        return clips
 
     async def get_clip_by_id(self, clip_id: int) -> Optional[ClipModel]:
         """
         Get a clip by its ID.
 
+        Clips are read through the clip cache,
+        so popular clips are served without a query.
+
         :param clip_id: ID of the clip
         :return: Found clip or None
         """
+        clip = await clip_cache.get_clip(clip_id)
+        if clip is not None:
+            return clip
         clips = await ClipModel.objects().where(ClipModel.id == clip_id)
-        return clips[0] if clips else None
+        if not clips:
+            return None
+        await clip_cache.set_clip(clips[0])
+        return clips[0]
 
     async def update_clip(
         self,
@@ -90,6 +145,8 @@ class ClipDAO:
         :param kwargs: Fields to update
         """
         await ClipModel.update(kwargs).where(ClipModel.id == clip_id)
+        await clip_cache.invalidate_clip(clip_id)
+        await clip_cache.invalidate_lists()
 
     async def delete_clip(self, clip_id: int) -> None:
         """
@@ -98,20 +155,43 @@ class ClipDAO:
         :param clip_id: ID of the clip to delete
         """
         await ClipModel.delete().where(ClipModel.id == clip_id)
+        await clip_cache.invalidate_clip(clip_id)
+        await clip_cache.invalidate_lists()
 
-    async def increment_play_count(self, clip_id: int) -> None:
+    async def increment_play_count(self, clip_id: int, amount: int = 1) -> None:
         """
         Increment the play count for a clip.
 
+        The increment is done by the database in a single statement,
+        so concurrent plays are never lost.
+
         :param clip_id: ID of the clip
+        :param amount: Number of plays to add
         """
-        clip = await self.get_clip_by_id(clip_id)
-        if clip:
-            await ClipModel.update(
-                {
-                    "play_count": clip.play_count + 1,
-                },
-            ).where(ClipModel.id == clip_id)
+        await ClipModel.update(
+            {
+                ClipModel.play_count: ClipModel.play_count + amount,
+            },
+        ).where(ClipModel.id == clip_id)
+        await clip_cache.invalidate_clip(clip_id)
+
+    async def increment_play_counts(self, counts: Dict[int, int]) -> None:
+        """
+        Increment play counts of many clips in one query.
+
+        :param counts: Mapping of clip IDs to number of plays to add
+        """
+        if not counts:
+            return
+        await ClipModel.raw(
+            "UPDATE clip_model SET play_count = clip_model.play_count + v.plays "
+            "FROM unnest({}::integer[], {}::integer[]) AS v(id, plays) "
+            "WHERE clip_model.id = v.id",
+            list(counts.keys()),
+            list(counts.values()),
+        )
+        for clip_id in counts:
+            await clip_cache.invalidate_clip(clip_id)
 
     async def search_clips(
         self,
@@ -122,22 +202,40 @@ class ClipDAO:
         """
         Search for clips by name, description, or tags.
 
+        Uses the full-text index on ``search_vector``. Results are ranked
+        by text relevance boosted by popularity of the clip.
+        Pages are cached for a short time, play counts
+        don't invalidate them.
+
         :param query: Search query string
         :param limit: Maximum number of results
         :param offset: Number of results to skip
         :return: List of matching clips
         """
-        return (
+        tsquery = build_prefix_tsquery(query)
+        if not tsquery:
+            return []
+        cache_params = ("search", tsquery, limit, offset)
+        cached = await clip_cache.get_list(cache_params)
+        if cached is not None:
+            return cached
+
+        clips = (
             await ClipModel.objects()
             .where(
-                (ClipModel.name.ilike(f"%{query}%"))
-                | (ClipModel.description.ilike(f"%{query}%"))
-                | (ClipModel.tags.ilike(f"%{query}%")),
+                WhereRaw("search_vector @@ to_tsquery('simple', {})", tsquery),
             )
             .order_by(
+                QueryString(
+                    "ts_rank(search_vector, to_tsquery('simple', {})) "
+                    "* (1 + ln(1 + play_count))",
+                    tsquery,
+                ),
                 ClipModel.play_count,
                 ascending=False,
             )
             .limit(limit)
             .offset(offset)
         )
+        await clip_cache.set_list(cache_params, clips)
+        return clips
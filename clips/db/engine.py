@@ -0,0 +1,59 @@
+import time
+from typing import Any, List, Optional, Sequence
+
+from piccolo.engine.postgres import PostgresEngine
+
+from clips.metrics import DB_POOL_ACQUIRE_SECONDS, DB_POOL_IN_USE, DB_POOL_SIZE
+
+
+class PooledPostgresEngine(PostgresEngine):
+    """
+    Postgres engine with bounded pool acquisition and pool metrics.
+
+    Piccolo acquires pool connections without a timeout, so a saturated
+    pool stalls requests indefinitely. This engine gives up after
+    ``acquire_timeout`` seconds and reports pool usage to prometheus.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        acquire_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.acquire_timeout = acquire_timeout
+
+    def report_pool_usage(self) -> None:
+        """Update pool size gauges from the current state of the pool."""
+        if self.pool is None:
+            DB_POOL_SIZE.set(0)
+            DB_POOL_IN_USE.set(0)
+            return
+        size = self.pool.get_size()
+        DB_POOL_SIZE.set(size)
+        DB_POOL_IN_USE.set(size - self.pool.get_idle_size())
+
+    async def close_connection_pool(self) -> None:
+        """Close the pool and reset pool gauges."""
+        await super().close_connection_pool()
+        self.report_pool_usage()
+
+    async def _run_in_pool(
+        self,
+        query: str,
+        args: Optional[Sequence[Any]] = None,
+    ) -> List[Any]:
+        if args is None:
+            args = []
+        if not self.pool:
+            raise ValueError("A pool isn't currently running.")
+
+        started = time.perf_counter()
+        async with self.pool.acquire(timeout=self.acquire_timeout) as connection:
+            DB_POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started)
+            self.report_pool_usage()
+            response = await connection.fetch(query, *args)
+        self.report_pool_usage()
+
+        return response
@@ -5,7 +5,12 @@ from piccolo.table import Table
 
 
 class ClipModel(Table):
-    """Model for storing audio clips and their metadata."""
+    """
+    Model for storing audio clips and their metadata.
+
+    The table also has a generated ``search_vector`` column
+    used for full-text search, see ``clips.db.schema``.
+    """
 
     name = Varchar(length=200, null=False, help_text="Name of the clip")
     url = Text(null=False, help_text="URL of the audio file")
@@ -0,0 +1,43 @@
+from piccolo.conf.apps import Finder
+from piccolo.table import create_db_tables
+
+from clips.db.models.clip_model import ClipModel
+
+
+async def create_search_index() -> None:
+    """
+    Create full-text search column and its index.
+
+    ``search_vector`` is a generated column, so postgres fills it
+    for existing rows when it's added and keeps it up to date on writes.
+    Names are weighted above tags, and tags above descriptions.
+    """
+    await ClipModel.raw(
+        "ALTER TABLE clip_model ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(tags, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+        ") STORED",
+    )
+    await ClipModel.raw(
+        "CREATE INDEX IF NOT EXISTS clip_model_search_vector "
+        "ON clip_model USING gin (search_vector)",
+    )
+
+
+async def create_db_indexes() -> None:
+    """Create indexes which are required by clip queries."""
+    # Keyset pagination walks clips by (created_at, id).
+    await ClipModel.create_index(
+        [ClipModel.created_at, ClipModel.id],
+        if_not_exists=True,
+    )
+    await create_search_index()
+
+
+async def create_db_schema() -> None:
+    """Create all database tables and indexes if they don't exist."""
+    tables = Finder().get_table_classes()
+    await create_db_tables(*tables, if_not_exists=True)
+    await create_db_indexes()
@@ -0,0 +1,42 @@
+"""
+Application specific prometheus metrics.
+
+HTTP level metrics are collected by prometheus-fastapi-instrumentator,
+these ones describe internals of the service. All of them are registered
+in the default registry, so they are exposed on the same endpoint and
+are aggregated across workers in multiprocess mode.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+DB_POOL_SIZE = Gauge(
+    "clips_db_pool_size",
+    "Number of connections currently open in the database pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_IN_USE = Gauge(
+    "clips_db_pool_in_use",
+    "Number of database pool connections currently acquired.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "clips_db_pool_acquire_seconds",
+    "Time spent waiting for a free database pool connection.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0),
+)
+
+CACHE_HITS = Counter(
+    "clips_cache_hits",
+    "Number of lookups served from cache.",
+    ["cache"],
+)
+CACHE_MISSES = Counter(
+    "clips_cache_misses",
+    "Number of lookups not found in cache.",
+    ["cache"],
+)
+CACHE_EVICTIONS = Counter(
+    "clips_cache_evictions",
+    "Number of entries evicted from cache because it was full.",
+    ["cache"],
+)
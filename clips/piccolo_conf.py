@@ -1,9 +1,9 @@
 from piccolo.conf.apps import AppRegistry
-from piccolo.engine.postgres import PostgresEngine
 
+from clips.db.engine import PooledPostgresEngine
 from clips.settings import settings
 
-DB = PostgresEngine(
+DB = PooledPostgresEngine(
     config={
         "database": settings.db_base,
         "user": settings.db_user,
@@ -11,6 +11,7 @@ DB = PostgresEngine(
         "host": settings.db_host,
         "port": settings.db_port,
     },
+    acquire_timeout=settings.db_pool_acquire_timeout,
 )
 
 
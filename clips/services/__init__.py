@@ -1,5 +1,6 @@
 """Services for clips."""
 
 from clips.services.db_seeder import DatabaseSeeder
+from clips.services.play_counter import PlayCounter, play_counter
 
-__all__ = ["DatabaseSeeder"]
+__all__ = ["DatabaseSeeder", "PlayCounter", "play_counter"]
@@ -0,0 +1,76 @@
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+from typing import Optional
+
+from clips.db.dao.clip_dao import ClipDAO
+from clips.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PlayCounter:
+    """
+    Service that buffers clip plays in memory and flushes them in batches.
+
+    Every worker keeps its own buffer, so recording a play never touches
+    the database. Buffered plays are written with a single query per flush.
+    """
+
+    def __init__(self, clip_dao: ClipDAO, flush_interval: float) -> None:
+        self.clip_dao = clip_dao
+        self.flush_interval = flush_interval
+        self._pending: Counter[int] = Counter()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of plays that are not yet written to the database."""
+        return sum(self._pending.values())
+
+    def record(self, clip_id: int, plays: int = 1) -> None:
+        """
+        Record plays of a clip.
+
+        :param clip_id: ID of the played clip
+        :param plays: Number of plays to record
+        """
+        self._pending[clip_id] += plays
+
+    async def flush(self) -> None:
+        """Write all buffered plays to the database."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, Counter()
+        try:
+            await self.clip_dao.increment_play_counts(dict(pending))
+        except Exception:
+            # Keep the plays, so they are written on the next flush.
+            self._pending.update(pending)
+            raise
+
+    async def start(self) -> None:
+        """Start periodic flushing in background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write remaining plays."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error(f"Cannot flush play counts: {exc!s}")
+
+
+play_counter = PlayCounter(ClipDAO(), flush_interval=settings.play_count_flush_interval)
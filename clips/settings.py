@@ -1,6 +1,7 @@
 import enum
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
@@ -19,6 +20,13 @@ class LogLevel(str, enum.Enum):
     FATAL = "FATAL"
 
 
+class CacheBackendType(str, enum.Enum):
+    """Possible cache backends."""
+
+    MEMORY = "MEMORY"
+    REDIS = "REDIS"
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -45,6 +53,35 @@ class Settings(BaseSettings):
     db_pass: str = "clips"
     db_base: str = "admin"
     db_echo: bool = False
+    # Connection pool sizing for the database engine
+    db_pool_min_size: int = 2
+    db_pool_max_size: int = 10
+    # Seconds to wait for a free pool connection before failing a query
+    db_pool_acquire_timeout: float = 10.0
+    # Seconds after which idle pool connections are closed
+    db_pool_max_inactive_lifetime: float = 300.0
+
+    # Where cached clips are stored. Use redis to share
+    # the cache between workers and hosts.
+    cache_backend: CacheBackendType = CacheBackendType.MEMORY
+    # Maximum number of entries kept in the in-process cache, 0 disables it
+    clip_cache_size: int = 10_000
+    # Seconds a cached clip stays valid
+    clip_cache_ttl: float = 60.0
+    # Seconds a cached page of clips stays valid
+    clip_list_cache_ttl: float = 5.0
+    # Seconds values fetched from redis are kept in memory of a worker
+    redis_local_cache_ttl: float = 5.0
+
+    # Variables for Redis
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_user: Optional[str] = None
+    redis_pass: Optional[str] = None
+    redis_base: Optional[int] = None
+
+    # Seconds between flushes of buffered play counts to the database
+    play_count_flush_interval: float = 1.0
 
     # This variable is used to define
     # multiproc_dir. It's required for [uvi|guni]corn projects.
@@ -66,6 +103,25 @@ class Settings(BaseSettings):
             path=f"/{self.db_base}",
         )
 
+    @property
+    def redis_url(self) -> URL:
+        """
+        Assemble REDIS URL from settings.
+
+        :return: redis URL.
+        """
+        path = ""
+        if self.redis_base is not None:
+            path = f"/{self.redis_base}"
+        return URL.build(
+            scheme="redis",
+            host=self.redis_host,
+            port=self.redis_port,
+            user=self.redis_user,
+            password=self.redis_pass,
+            path=path,
+        )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="CLIPS_",
@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from clips.db.models.clip_model import ClipModel
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(clip: ClipModel) -> str:
+    """
+    Build an opaque cursor pointing right after the given clip.
+
+    :param clip: last clip of the current page.
+    :return: url-safe cursor string.
+    """
+    payload = json.dumps([clip.created_at.isoformat(), clip.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Parse cursor created by :func:`encode_cursor`.
+
+    :param cursor: cursor string received from the client.
+    :return: ``(created_at, id)`` of the clip the cursor points after.
+    :raises ValueError: if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, clip_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(clip_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
@@ -1,11 +1,17 @@
 from typing import List, Optional
 from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from fastapi.responses import RedirectResponse
 
 from clips.db.dao.clip_dao import ClipDAO
 from clips.db.models.clip_model import ClipModel
+from clips.services.play_counter import play_counter
+from clips.web.api.clips.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+)
 from clips.web.api.clips.schema import (
     ClipDTO,
     ClipInputDTO,
@@ -17,23 +23,49 @@ router = APIRouter()
 
 @router.get("/", response_model=List[ClipDTO])
 async def get_clips(
+    response: Response,
     limit: int = Query(20, description="Maximum number of clips to return"),
     offset: int = Query(0, description="Number of clips to skip"),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"Cursor from the {NEXT_CURSOR_HEADER} header of previous page",
+    ),
     search: Optional[str] = Query(None, description="Search term"),
     clip_dao: ClipDAO = Depends(),
 ) -> List[ClipModel]:
     """
     Retrieve all clips from the database.
 
+    Listing without search returns a cursor for the next page
+    in the X-Next-Cursor header. Passing it back as ``cursor``
+    fetches the next page at constant cost, unlike ``offset``.
+
+    :param response: Outgoing response
     :param limit: Maximum number of clips to return
     :param offset: Number of clips to skip
+    :param cursor: Cursor pointing after the last clip of previous page
     :param search: Optional search term to filter clips
     :param clip_dao: DAO for clip models
     :return: List of clip objects from database
+    :raises HTTPException: If cursor is invalid or combined with search
     """
     if search:
+        if cursor:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor pagination is not supported for search",
+            )
         return await clip_dao.search_clips(query=search, limit=limit, offset=offset)
-    return await clip_dao.get_all_clips(limit=limit, offset=offset)
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    clips = await clip_dao.get_all_clips(limit=limit, offset=offset, after=after)
+    if clips and len(clips) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(clips[-1])
+    return clips
 
 
 @router.get("/{clip_id}/stream")
@@ -53,8 +85,8 @@ async def stream_clip(
     if not clip:
         raise HTTPException(status_code=404, detail="Clip not found")
 
-    # Increment play count
-    await clip_dao.increment_play_count(clip_id=clip_id)
+    # Play counts are buffered and written to the database in batches
+    play_counter.record(clip_id)
 
     # Parse URL to check if it's a remote URL
     parsed_url = urlparse(clip.url)
@@ -3,14 +3,59 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from loguru import logger
-from piccolo.conf.apps import Finder
-from piccolo.table import create_tables
+from piccolo.engine import engine_finder
 from prometheus_fastapi_instrumentator.instrumentation import (
     PrometheusFastApiInstrumentator,
 )
+from redis.asyncio import Redis
 
+from clips.db.cache import LRUCache, RedisCacheBackend, clip_cache
 from clips.db.dao.clip_dao import ClipDAO
+from clips.db.schema import create_db_schema
 from clips.services.db_seeder import DatabaseSeeder
+from clips.services.play_counter import play_counter
+from clips.settings import CacheBackendType, settings
+
+
+async def setup_db_pool() -> None:  # pragma: no cover
+    """Starts connection pool of the database engine."""
+    engine = engine_finder()
+    await engine.start_connection_pool(
+        min_size=settings.db_pool_min_size,
+        max_size=settings.db_pool_max_size,
+        max_inactive_connection_lifetime=settings.db_pool_max_inactive_lifetime,
+    )
+    engine.report_pool_usage()
+
+
+async def shutdown_db_pool() -> None:  # pragma: no cover
+    """Closes connection pool of the database engine."""
+    engine = engine_finder()
+    await engine.close_connection_pool()
+
+
+async def setup_cache() -> None:  # pragma: no cover
+    """Switches clip cache to redis, if it's configured."""
+    if settings.cache_backend != CacheBackendType.REDIS:
+        return
+    backend = RedisCacheBackend(
+        Redis.from_url(str(settings.redis_url)),
+        local=LRUCache(
+            "clip_local",
+            max_size=settings.clip_cache_size,
+            ttl=settings.redis_local_cache_ttl,
+        ),
+    )
+    await backend.start()
+    clip_cache.backend = backend
+
+
+async def shutdown_cache() -> None:  # pragma: no cover
+    """Closes connections of the clip cache."""
+    backend = clip_cache.backend
+    await backend.stop()
+    if isinstance(backend, RedisCacheBackend):
+        await backend.redis.aclose()
 
 
 def setup_prometheus(app: FastAPI) -> None:  # pragma: no cover
@@ -32,7 +77,8 @@ async def lifespan_setup(
     Actions to run on application startup.
 
     This function uses fastAPI app to store data
-    in the state, such as db_engine.
+    in the state, such as db_engine. The database
+    connection pool lives as long as the application.
 
     :param app: the fastAPI application.
     :return: function that actually performs actions.
@@ -41,12 +87,13 @@ async def lifespan_setup(
     app.middleware_stack = None
     setup_prometheus(app)
     app.middleware_stack = app.build_middleware_stack()
+    await setup_db_pool()
+    await setup_cache()
 
     # Create database tables if they don't exist
     try:
         logger.info("Ensuring database tables exist...")
-        tables = Finder().get_table_classes()
-        create_tables(*tables, if_not_exists=True)
+        await create_db_schema()
         logger.info("Database tables created or already exist")
 
         # Now check if database needs to be seeded
@@ -63,4 +110,10 @@ async def lifespan_setup(
     except Exception as e:
         logger.error(f"Error during database initialization/seeding: {e!s}")
 
+    await play_counter.start()
+
     yield
+
+    await play_counter.stop()
+    await shutdown_cache()
+    await shutdown_db_pool()
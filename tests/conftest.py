@@ -5,9 +5,11 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 from piccolo.conf.apps import Finder
 from piccolo.engine.postgres import PostgresEngine
-from piccolo.table import create_tables, drop_tables
+from piccolo.table import drop_tables
 
+from clips.db.cache import clip_cache
 from clips.db.dao.clip_dao import ClipDAO
+from clips.db.schema import create_db_schema
 from clips.settings import settings
 from clips.web.application import get_app
 
@@ -63,13 +65,14 @@ async def setup_db() -> AsyncGenerator[None, None]:
     if db_exists:
         await drop_database(engine)
     await engine.run_ddl(f"CREATE DATABASE {settings.db_base}")
-    tables = Finder().get_table_classes()
-    create_tables(*tables, if_not_exists=True)
+    await create_db_schema()
+    await clip_cache.clear()
 
     yield
 
-    drop_tables(*tables)
+    drop_tables(*Finder().get_table_classes())
     await drop_database(engine)
+    await engine.close_connection_pool()
 
 
 @pytest.fixture
@@ -2,6 +2,7 @@ import pytest
 from httpx import AsyncClient
 
 from clips.db.dao.clip_dao import ClipDAO
+from clips.services.play_counter import play_counter
 
 
 @pytest.mark.anyio
@@ -151,6 +152,7 @@ async def test_stream_clip_increments_plays(
 
     # Stream the clip
     await client.get(f"/api/clips/{test_clip.id}/stream")
+    await play_counter.flush()
 
     # Check play count was incremented
     updated_clip = await clip_dao.get_clip_by_id(test_clip.id)
@@ -158,6 +160,34 @@ async def test_stream_clip_increments_plays(
     assert updated_clip.play_count == 1
 
 
+@pytest.mark.anyio
+async def test_get_clips_with_cursor(client: AsyncClient, clip_dao: ClipDAO) -> None:
+    """Test walking through all clips with cursor pagination."""
+    created_ids = []
+    for index in range(5):
+        clip = await clip_dao.create_clip(
+            name=f"Cursor Song {index}",
+            url=f"https://example.com/cursor{index}.mp3",
+        )
+        created_ids.append(clip.id)
+
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/clips/", params=params)
+        assert response.status_code == 200
+        seen_ids.extend(clip["id"] for clip in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert seen_ids == list(reversed(created_ids))
+
+    response = await client.get("/api/clips/", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
 @pytest.fixture
 async def clip_dao() -> ClipDAO:
     """Fixture for ClipDAO."""
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from prometheus_client import REGISTRY
+
+from clips.db.cache import LRUCache, RedisCacheBackend, clip_cache
+from clips.db.dao.clip_dao import ClipDAO
+
+
+class FakeClock:
+    """Clock which is moved forward by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current time."""
+        return self.now
+
+
+@pytest.mark.anyio
+async def test_lru_eviction() -> None:
+    """Test that least recently used entries are evicted first."""
+    cache: LRUCache[int, str] = LRUCache("test_lru", max_size=2, ttl=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    assert cache.get(1) == "one"
+
+    cache.set(3, "three")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "one"
+    assert cache.get(3) == "three"
+    assert (
+        REGISTRY.get_sample_value(
+            "clips_cache_evictions_total",
+            {"cache": "test_lru"},
+        )
+        == 1
+    )
+
+
+@pytest.mark.anyio
+async def test_ttl_expiry() -> None:
+    """Test that entries expire after ttl."""
+    clock = FakeClock()
+    cache: LRUCache[int, str] = LRUCache("test_ttl", max_size=10, ttl=5, clock=clock)
+    cache.set(1, "one")
+    cache.set(2, "two", ttl=1)
+
+    clock.now = 1
+    assert cache.get(2) is None
+    clock.now = 4.9
+    assert cache.get(1) == "one"
+    clock.now = 5
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_clip_dao_invalidates_cache() -> None:
+    """Test that DAO writes invalidate cached clips and lists."""
+    clip_dao = ClipDAO()
+    clip = await clip_dao.create_clip(
+        name="Cached",
+        url="https://example.com/cached.mp3",
+    )
+
+    await clip_dao.get_clip_by_id(clip.id)
+    cached = await clip_cache.get_clip(clip.id)
+    assert cached is not None
+    assert cached.name == "Cached"
+    assert cached.created_at == clip.created_at
+    assert [cached.id for cached in await clip_dao.get_all_clips()] == [clip.id]
+
+    await clip_dao.update_clip(clip.id, name="Renamed")
+    assert await clip_cache.get_clip(clip.id) is None
+    updated = await clip_dao.get_clip_by_id(clip.id)
+    assert updated is not None
+    assert updated.name == "Renamed"
+    assert [cached.name for cached in await clip_dao.get_all_clips()] == ["Renamed"]
+
+    await clip_dao.delete_clip(clip.id)
+    assert await clip_dao.get_clip_by_id(clip.id) is None
+    assert await clip_dao.get_all_clips() == []
+
+
+@pytest.mark.anyio
+async def test_redis_backend_invalidates_other_workers() -> None:
+    """Test that deletes in one worker drop local copies in another."""
+    server = FakeServer()
+    workers = [
+        RedisCacheBackend(
+            FakeRedis(server=server),
+            local=LRUCache("test_redis_local", max_size=10, ttl=60),
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        await worker.start()
+    first, second = workers
+
+    try:
+        await first.set("clip:1", b"old", ttl=60)
+        assert await second.get("clip:1") == b"old"
+        assert second.local.get("clip:1") == b"old"
+
+        await first.delete("clip:1")
+        for _ in range(100):
+            if second.local.get("clip:1") is None:
+                break
+            await asyncio.sleep(0.01)
+
+        assert second.local.get("clip:1") is None
+        assert await second.get("clip:1") is None
+
+        assert await second.get_counter("version") == 0
+        await first.incr("version")
+        assert await second.get_counter("version") == 1
+    finally:
+        for worker in workers:
+            await worker.stop()
+            await worker.redis.aclose()
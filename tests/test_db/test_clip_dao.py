@@ -164,3 +164,56 @@ async def test_increment_play_count() -> None:
     updated_clip = await clip_dao.get_clip_by_id(test_clip.id)
     assert updated_clip is not None
     assert updated_clip.play_count == 2
+
+
+@pytest.mark.anyio
+async def test_increment_play_counts() -> None:
+    """Test incrementing play counts of many clips at once."""
+    clip_dao = ClipDAO()
+
+    first = await clip_dao.create_clip(
+        name="First",
+        url="https://example.com/first.mp3",
+    )
+    second = await clip_dao.create_clip(
+        name="Second",
+        url="https://example.com/second.mp3",
+    )
+
+    await clip_dao.increment_play_counts({first.id: 3, second.id: 1})
+    await clip_dao.increment_play_counts({first.id: 2})
+
+    first_clip = await clip_dao.get_clip_by_id(first.id)
+    second_clip = await clip_dao.get_clip_by_id(second.id)
+    assert first_clip is not None
+    assert first_clip.play_count == 5
+    assert second_clip is not None
+    assert second_clip.play_count == 1
+
+
+@pytest.mark.anyio
+async def test_search_clips_ranking() -> None:
+    """Test prefix matching and popularity ranking of search."""
+    clip_dao = ClipDAO()
+
+    quiet = await clip_dao.create_clip(
+        name="Imagine Dragons Live",
+        url="https://example.com/quiet.mp3",
+        tags="rock",
+    )
+    popular = await clip_dao.create_clip(
+        name="Imagine Dragons Studio",
+        url="https://example.com/popular.mp3",
+        tags="rock",
+    )
+    await clip_dao.create_clip(
+        name="Dragon Tales",
+        url="https://example.com/other.mp3",
+        tags="kids",
+    )
+    await clip_dao.increment_play_count(popular.id, amount=50)
+
+    results = await clip_dao.search_clips("imag drag")
+    assert [clip.id for clip in results] == [popular.id, quiet.id]
+
+    assert await clip_dao.search_clips("?!") == []
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from piccolo.engine import engine_finder
+from prometheus_client import REGISTRY
+
+from clips.db.engine import PooledPostgresEngine
+
+
+@pytest.mark.anyio
+async def test_pool_metrics() -> None:
+    """Test that pool usage is reported while the pool is running."""
+    engine = engine_finder()
+    assert isinstance(engine, PooledPostgresEngine)
+
+    await engine.start_connection_pool(min_size=1, max_size=2)
+    try:
+        await engine.run_ddl("SELECT 1")
+        assert REGISTRY.get_sample_value("clips_db_pool_size") == 1
+        assert REGISTRY.get_sample_value("clips_db_pool_in_use") == 0
+        assert REGISTRY.get_sample_value("clips_db_pool_acquire_seconds_count")
+    finally:
+        await engine.close_connection_pool()
+
+    assert REGISTRY.get_sample_value("clips_db_pool_size") == 0
+
+
+@pytest.mark.anyio
+async def test_pool_acquire_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that queries fail when no pool connection frees up in time."""
+    engine = engine_finder()
+    monkeypatch.setattr(engine, "acquire_timeout", 0.05)
+
+    await engine.start_connection_pool(min_size=1, max_size=1)
+    try:
+        async with engine.pool.acquire():
+            with pytest.raises(asyncio.TimeoutError):
+                await engine.run_ddl("SELECT 1")
+    finally:
+        await engine.close_connection_pool()
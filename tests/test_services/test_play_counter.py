@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from clips.db.dao.clip_dao import ClipDAO
+from clips.services.play_counter import PlayCounter
+
+
+@pytest.mark.anyio
+async def test_concurrent_plays_are_counted() -> None:
+    """Test that buffered plays are all written on flush."""
+    clip_dao = ClipDAO()
+    counter = PlayCounter(clip_dao, flush_interval=60)
+    clip = await clip_dao.create_clip(
+        name="Popular",
+        url="https://example.com/popular.mp3",
+    )
+
+    async def play() -> None:
+        counter.record(clip.id)
+
+    await asyncio.gather(*(play() for _ in range(300)))
+    assert counter.pending == 300
+
+    await counter.flush()
+
+    assert counter.pending == 0
+    updated_clip = await clip_dao.get_clip_by_id(clip.id)
+    assert updated_clip is not None
+    assert updated_clip.play_count == 300
+
+
+@pytest.mark.anyio
+async def test_stop_flushes_pending_plays() -> None:
+    """Test that stopping the counter writes remaining plays."""
+    clip_dao = ClipDAO()
+    counter = PlayCounter(clip_dao, flush_interval=60)
+    clip = await clip_dao.create_clip(
+        name="Stopped",
+        url="https://example.com/stopped.mp3",
+    )
+
+    await counter.start()
+    counter.record(clip.id, plays=2)
+    await counter.stop()
+
+    updated_clip = await clip_dao.get_clip_by_id(clip.id)
+    assert updated_clip is not None
+    assert updated_clip.play_count == 2